@@ -1,54 +1,72 @@
 import logging
 import os
+import random
+import signal
+import threading
 import time
+from typing import List
 
 import spotipy
-from libsonic.connection import Connection
 from spotipy.oauth2 import SpotifyClientCredentials
 
-from utils.helperClasses import UserInputs
+from utils.helperClasses import Playlist, UserInputs
+from utils.navidrome import NavidromeConnection, clear_search_cache
 from utils.spotify import spotify_playlist_sync
 
 
+logger = logging.getLogger(__name__)
+
+# Environment is read once at startup; configuration never changes at runtime.
+_ENV = dict(os.environ)
+
+
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
+
 def _env_flag(name: str, default: str = "0") -> bool:
-    value = os.getenv(name, default)
+    value = _ENV.get(name, default)
     if value is None:
         return False
-    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+    # Most flags are plain 1/0, skip normalizing those
+    if value == "1":
+        return True
+    if value == "0":
+        return False
+    return str(value).strip().lower() in _TRUE_VALUES
 
 
 def _env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     try:
         return int(value)
     except ValueError:
-        logging.getLogger(__name__).warning(
+        logger.warning(
             "Invalid integer for %s=%s; using default %s", name, value, default
         )
         return default
 
 
 def _env_float(name: str, default: float, minimum: float | None = None, maximum: float | None = None) -> float:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     try:
         result = float(value)
     except ValueError:
-        logging.getLogger(__name__).warning(
+        logger.warning(
             "Invalid float for %s=%s; using default %.2f", name, value, default
         )
         return default
 
     if minimum is not None and result < minimum:
-        logging.getLogger(__name__).warning(
+        logger.warning(
             "%s below minimum %.2f; using %.2f", name, minimum, default
         )
         return default
     if maximum is not None and result > maximum:
-        logging.getLogger(__name__).warning(
+        logger.warning(
             "%s above maximum %.2f; using %.2f", name, maximum, default
         )
         return default
@@ -57,7 +75,7 @@ def _env_float(name: str, default: float, minimum: float | None = None, maximum:
 
 
 def _configure_logging() -> None:
-    level_name = os.getenv("LOG_LEVEL")
+    level_name = _ENV.get("LOG_LEVEL")
     verbose_requested = _env_flag("VERBOSE_LOGGING", "0")
 
     if level_name:
@@ -80,28 +98,57 @@ def _configure_logging() -> None:
 
 _configure_logging()
 
-logger = logging.getLogger(__name__)
 
-wait_seconds = max(_env_int("SECONDS_TO_WAIT", 86400), 0)
-match_threshold = _env_float("NAVIDROME_MATCH_THRESHOLD", 0.6, 0.0, 1.0)
+def _load_user_inputs() -> UserInputs:
+    wait_seconds = max(_env_int("SECONDS_TO_WAIT", 86400), 0)
+    return UserInputs(
+        navidrome_base_url=_ENV.get("NAVIDROME_BASE_URL"),
+        navidrome_port=_env_int("NAVIDROME_PORT", 4533),
+        navidrome_username=_ENV.get("NAVIDROME_USERNAME"),
+        navidrome_password=_ENV.get("NAVIDROME_PASSWORD"),
+        navidrome_legacy_auth=_env_flag("NAVIDROME_LEGACY_AUTH", "0"),
+        write_missing_as_csv=_env_flag("WRITE_MISSING_AS_CSV", "0"),
+        append_service_suffix=_env_flag("APPEND_SERVICE_SUFFIX", "1"),
+        add_playlist_description=_env_flag("ADD_PLAYLIST_DESCRIPTION", "1"),
+        append_instead_of_sync=_env_flag("APPEND_INSTEAD_OF_SYNC", "0"),
+        wait_seconds=wait_seconds,
+        max_wait_seconds=max(_env_int("MAX_SECONDS_TO_WAIT", wait_seconds), wait_seconds),
+        retry_wait_seconds=max(_env_int("RETRY_SECONDS_TO_WAIT", 60), 1),
+        match_confidence_threshold=_env_float("NAVIDROME_MATCH_THRESHOLD", 0.6, 0.0, 1.0),
+        navidrome_search_concurrency=max(_env_int("NAVIDROME_SEARCH_CONCURRENCY", 8), 1),
+        navidrome_search_limit=max(_env_int("NAVIDROME_SEARCH_LIMIT", 8), 1),
+        navidrome_song_index=_env_flag("NAVIDROME_SONG_INDEX", "0"),
+        navidrome_add_chunk_size=max(_env_int("NAVIDROME_ADD_CHUNK_SIZE", 200), 1),
+        playlist_sync_concurrency=max(_env_int("PLAYLIST_SYNC_CONCURRENCY", 2), 1),
+        spotipy_client_id=_ENV.get("SPOTIFY_CLIENT_ID"),
+        spotipy_client_secret=_ENV.get("SPOTIFY_CLIENT_SECRET"),
+        spotify_user_id=_ENV.get("SPOTIFY_USER_ID"),
+    )
+
+
+userInputs = _load_user_inputs()
+
+# _wake_event ends the wait between cycles early; _stop_event also ends the loop
+_wake_event = threading.Event()
+_stop_event = threading.Event()
 
 
-userInputs = UserInputs(
-    navidrome_base_url=os.getenv("NAVIDROME_BASE_URL"),
-    navidrome_port=_env_int("NAVIDROME_PORT", 4533),
-    navidrome_username=os.getenv("NAVIDROME_USERNAME"),
-    navidrome_password=os.getenv("NAVIDROME_PASSWORD"),
-    navidrome_legacy_auth=_env_flag("NAVIDROME_LEGACY_AUTH", "0"),
-    write_missing_as_csv=_env_flag("WRITE_MISSING_AS_CSV", "0"),
-    append_service_suffix=_env_flag("APPEND_SERVICE_SUFFIX", "1"),
-    add_playlist_description=_env_flag("ADD_PLAYLIST_DESCRIPTION", "1"),
-    append_instead_of_sync=_env_flag("APPEND_INSTEAD_OF_SYNC", "0"),
-    wait_seconds=wait_seconds,
-    match_confidence_threshold=match_threshold,
-    spotipy_client_id=os.getenv("SPOTIFY_CLIENT_ID"),
-    spotipy_client_secret=os.getenv("SPOTIFY_CLIENT_SECRET"),
-    spotify_user_id=os.getenv("SPOTIFY_USER_ID"),
-)
+def _request_shutdown(signum: int, _frame) -> None:
+    logger.info("Received %s, shutting down after the current step", signal.Signals(signum).name)
+    _stop_event.set()
+    _wake_event.set()
+
+
+def _request_resync(signum: int, _frame) -> None:
+    logger.info("Received %s, starting the next sync cycle now", signal.Signals(signum).name)
+    _wake_event.set()
+
+
+def _install_signal_handlers() -> None:
+    signal.signal(signal.SIGTERM, _request_shutdown)
+    signal.signal(signal.SIGINT, _request_shutdown)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _request_resync)
 
 
 def _has_required_navidrome_inputs(inputs: UserInputs) -> bool:
@@ -121,38 +168,72 @@ def _has_required_navidrome_inputs(inputs: UserInputs) -> bool:
     return True
 
 
+# Reused across cycles; dropped when a ping fails so the next cycle reconnects
+_navidrome: NavidromeConnection | None = None
 
-def run_sync_cycle(inputs: UserInputs) -> bool:
-    if not _has_required_navidrome_inputs(inputs):
-        return False
-
-    logger.info("Starting playlist sync cycle")
-    logger.debug(
-        "Configured options: append_suffix=%s append_instead_of_sync=%s "
-        "write_missing_as_csv=%s add_description=%s wait_seconds=%s match_threshold=%.2f",
-        inputs.append_service_suffix,
-        inputs.append_instead_of_sync,
-        inputs.write_missing_as_csv,
-        inputs.add_playlist_description,
-        inputs.wait_seconds,
-        inputs.match_confidence_threshold,
-    )
 
-    cycle_start = time.monotonic()
+def _get_navidrome(inputs: UserInputs) -> NavidromeConnection | None:
+    global _navidrome
 
     try:
-        navidrome = Connection(
-            baseUrl=inputs.navidrome_base_url,
-            port=inputs.navidrome_port,
-            username=inputs.navidrome_username,
-            password=inputs.navidrome_password,
-            legacyAuth=inputs.navidrome_legacy_auth,
-        )
-        if hasattr(navidrome, "ping"):
-            navidrome.ping()
+        if _navidrome is None:
+            _navidrome = NavidromeConnection(
+                baseUrl=inputs.navidrome_base_url,
+                port=inputs.navidrome_port,
+                username=inputs.navidrome_username,
+                password=inputs.navidrome_password,
+                legacyAuth=inputs.navidrome_legacy_auth,
+            )
+        # libsonic reports ping failures as False rather than raising
+        if not _navidrome.ping():
+            raise ConnectionError("server did not answer ping")
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to connect to Navidrome: %s", exc)
-        return False
+        _navidrome = None
+        return None
+    return _navidrome
+
+
+def _playlists_fingerprint(playlists: List[Playlist]) -> int:
+    return hash(tuple((playlist.id, playlist.snapshot_id) for playlist in playlists))
+
+
+def run_sync_cycle(inputs: UserInputs) -> int | None:
+    """Run one sync cycle.
+
+    Returns a fingerprint of the source playlists that were synced, which
+    changes whenever a playlist is added, removed or edited, or None if the
+    cycle failed.
+    """
+    logger.info("Starting playlist sync cycle")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Configured options: append_suffix=%s append_instead_of_sync=%s "
+            "write_missing_as_csv=%s add_description=%s wait_seconds=%s max_wait_seconds=%s "
+            "retry_wait_seconds=%s match_threshold=%.2f search_concurrency=%s search_limit=%s "
+            "song_index=%s add_chunk_size=%s playlist_sync_concurrency=%s",
+            inputs.append_service_suffix,
+            inputs.append_instead_of_sync,
+            inputs.write_missing_as_csv,
+            inputs.add_playlist_description,
+            inputs.wait_seconds,
+            inputs.max_wait_seconds,
+            inputs.retry_wait_seconds,
+            inputs.match_confidence_threshold,
+            inputs.navidrome_search_concurrency,
+            inputs.navidrome_search_limit,
+            inputs.navidrome_song_index,
+            inputs.navidrome_add_chunk_size,
+            inputs.playlist_sync_concurrency,
+        )
+
+    cycle_start = time.monotonic()
+    # Library contents may have changed since the previous cycle
+    clear_search_cache()
+
+    navidrome = _get_navidrome(inputs)
+    if navidrome is None:
+        return None
 
     logger.info("Starting Spotify playlist sync")
 
@@ -179,37 +260,84 @@ def run_sync_cycle(inputs: UserInputs) -> bool:
             "Missing one or more Spotify authorization variables, skipping Spotify sync",
         )
 
+    playlists: List[Playlist] | None = []
     if spotify_client is not None:
         try:
-            spotify_playlist_sync(spotify_client, navidrome, inputs)
+            playlists = spotify_playlist_sync(spotify_client, navidrome, inputs)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Spotify playlist sync failed: %s", exc)
+            playlists = None
 
     logger.info("Spotify playlist sync complete")
     logger.info(
         "Playlist sync cycle finished in %.2f seconds",
         time.monotonic() - cycle_start,
     )
-    return True
+    if playlists is None:
+        return None
+    return _playlists_fingerprint(playlists)
+
+
+def _failure_wait(inputs: UserInputs, failures: int) -> float:
+    """Exponential backoff with jitter after consecutive failed cycles."""
+    delay = min(
+        inputs.retry_wait_seconds * 2 ** min(failures - 1, 16),
+        max(inputs.max_wait_seconds, inputs.retry_wait_seconds),
+    )
+    return delay * random.uniform(0.8, 1.0)
+
+
+def _idle_wait(inputs: UserInputs, previous_wait: int, changed: bool) -> int:
+    """Reset to the configured wait after changes, otherwise back off towards the maximum."""
+    if changed:
+        return inputs.wait_seconds
+    return min(previous_wait * 2, inputs.max_wait_seconds)
 
 
 def main() -> None:
     run_forever = not _env_flag("RUN_ONCE", "0")
 
-    while True:
-        should_continue = run_sync_cycle(userInputs)
-        if not should_continue:
-            break
+    if not _has_required_navidrome_inputs(userInputs):
+        return
+
+    _install_signal_handlers()
 
-        if not run_forever:
+    failures = 0
+    previous_fingerprint = None
+    idle_wait = userInputs.wait_seconds
+
+    while not _stop_event.is_set():
+        fingerprint = run_sync_cycle(userInputs)
+        if not run_forever or _stop_event.is_set():
             break
 
-        if userInputs.wait_seconds <= 0:
-            logger.info("RUN_ONCE disabled and wait_seconds=0, restarting immediately")
-            continue
+        if fingerprint is None:
+            failures += 1
+            wait = _failure_wait(userInputs, failures)
+            logger.warning(
+                "Sync cycle failed (%s in a row), retrying in %.0f seconds",
+                failures,
+                wait,
+            )
+        else:
+            failures = 0
+            idle_wait = _idle_wait(
+                userInputs, idle_wait, fingerprint != previous_fingerprint
+            )
+            previous_fingerprint = fingerprint
+            wait = idle_wait
+
+            if wait <= 0:
+                logger.info("RUN_ONCE disabled and wait_seconds=0, restarting immediately")
+                continue
+
+            logger.info("Sleeping for %s seconds", wait)
 
-        logger.info("Sleeping for %s seconds", userInputs.wait_seconds)
-        time.sleep(userInputs.wait_seconds)
+        if _wake_event.wait(wait):
+            _wake_event.clear()
+            # A resync request skips the remaining wait and resets the backoff
+            idle_wait = userInputs.wait_seconds
+            failures = 0
 
 
 if __name__ == "__main__":
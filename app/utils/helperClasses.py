@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from .navidrome_score import normalize
 
 
 @dataclass
@@ -7,6 +9,15 @@ class Track:
     artist: str
     album: str
     url: str
+    # Matching forms of the fields above, computed once per track
+    title_norm: str = field(init=False, repr=False, compare=False)
+    artist_norm: str = field(init=False, repr=False, compare=False)
+    album_norm: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.title_norm = normalize(self.title)
+        self.artist_norm = normalize(self.artist)
+        self.album_norm = normalize(self.album)
 
 
 @dataclass
@@ -14,9 +25,11 @@ class Playlist:
     id: str
     name: str
     description: str
+    # Source-side revision marker, changes whenever the playlist is edited
+    snapshot_id: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserInputs:
     navidrome_base_url: str
     navidrome_port: int
@@ -29,7 +42,14 @@ class UserInputs:
     add_playlist_description: bool
     append_instead_of_sync: bool
     wait_seconds: int
+    max_wait_seconds: int
+    retry_wait_seconds: int
     match_confidence_threshold: float
+    navidrome_search_concurrency: int
+    navidrome_search_limit: int
+    navidrome_song_index: bool
+    navidrome_add_chunk_size: int
+    playlist_sync_concurrency: int
 
     spotipy_client_id: str
     spotipy_client_secret: str
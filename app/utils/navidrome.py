@@ -1,16 +1,58 @@
 import csv
+import io
 import logging
 import pathlib
-from difflib import SequenceMatcher
-from typing import Iterable, List, Tuple
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import FrozenSet, Iterable, Iterator, List, Sequence, Tuple
 
 from libsonic.connection import Connection
 
 from .helperClasses import Playlist, Track, UserInputs
+from .navidrome_score import (
+    normalize_candidate,
+    pick_best_match,
+    search_text,
+    tokens,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized searches/matches kept for a single sync cycle.
+_SEARCH_CACHE_SIZE = 4096
+_DEFAULT_SEARCH_LIMIT = 8
+# Roughly 8 KB of songIdToAdd parameters per updatePlaylist request
+_DEFAULT_ADD_TRACKS_CHUNK_SIZE = 200
+_SONG_INDEX_PAGE_SIZE = 500
+# Tokens found in more than this share of the library (stop-words, prolific
+# artists) are too common to rank candidates by
+_SONG_INDEX_COMMON_TOKEN_SHARE = 0.02
+_SONG_INDEX_COMMON_TOKEN_MIN = 64
+_CSV_COLUMNS = ("title", "artist", "album", "url")
+_csv_row = attrgetter(*_CSV_COLUMNS)
+
+
+class NavidromeConnection(Connection):
+    """libsonic Connection that reuses one set of auth parameters.
+
+    libsonic draws a fresh salt from os.urandom and re-hashes the password for
+    every request. Subsonic servers accept a reused salt/token pair, so the
+    auth parameters are computed once when the connection is created.
+    Credentials must not be changed after construction.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._base_qdict = super()._getBaseQdict()
+
+    def _getBaseQdict(self) -> dict:
+        # Callers add request parameters to the returned dict, hand out a copy
+        return dict(self._base_qdict)
+
 
 def _write_csv(tracks: List[Track], name: str, path: str = "/data") -> None:
     """Write given tracks with given name as a csv."""
@@ -20,11 +62,13 @@ def _write_csv(tracks: List[Track], name: str, path: str = "/data") -> None:
 
     logger.debug("Writing CSV with %s missing tracks at %s", len(tracks), file)
 
-    with open(file, "w", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(Track.__annotations__.keys())
-        for track in tracks:
-            writer.writerow([track.title, track.artist, track.album, track.url])
+    # Build the whole file in memory so slow (e.g. network) storage sees one write
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_COLUMNS)
+    writer.writerows(map(_csv_row, tracks))
+    with open(file, "w", encoding="utf-8", newline="") as csvfile:
+        csvfile.write(buffer.getvalue())
 
 
 def _delete_csv(name: str, path: str = "/data") -> None:
@@ -62,112 +106,300 @@ def _persist_missing_tracks(
             logger.info("Failed to delete %s.csv: %s", playlist_name, exc)
 
 
-def _normalize(value: str | None) -> str:
-    return value.lower().strip() if value else ""
+def _items(value: list | dict | None) -> Sequence[dict]:
+    """Return a Subsonic list field as a sequence of entries.
 
+    Subsonic returns a bare object instead of a list for a single result, and
+    omits the field when there are none.
+    """
+    if type(value) is list:
+        return value
+    return (value,) if value else ()
 
-def _sequence_score(a: str, b: str) -> float:
-    if not a or not b:
-        return 0.0
-    return SequenceMatcher(None, a, b).quick_ratio()
 
+@lru_cache(maxsize=_SEARCH_CACHE_SIZE)
+def _search_tracks(
+    navidrome: Connection, title: str, artist: str, limit: int = _DEFAULT_SEARCH_LIMIT
+) -> Tuple[dict, ...]:
+    """Return Navidrome songs for a title/artist query in ``search_text`` form.
 
-def _score_candidate(candidate: dict, track: Track) -> float:
-    title_score = _sequence_score(_normalize(candidate.get("title")), _normalize(track.title))
-    artist_score = _sequence_score(_normalize(candidate.get("artist")), _normalize(track.artist))
-    album_score = _sequence_score(_normalize(candidate.get("album")), _normalize(track.album))
-    # Weight title highest, then artist, then album
-    return (title_score * 0.6) + (artist_score * 0.3) + (album_score * 0.1)
+    Results are memoized for the current sync cycle so a track that appears
+    in several playlists is only searched once. Search errors propagate so
+    that failures are never cached.
+    """
+    query = " ".join(part for part in (title, artist) if part)
+    if not query:
+        return ()
 
+    logger.debug("Searching Navidrome for track '%s'", query)
 
-def _ensure_iterable_songs(songs: Iterable | None) -> List[dict]:
-    if songs is None:
-        return []
-    if isinstance(songs, list):
-        return songs
-    return [songs]
+    response = navidrome.search2(
+        query=query,
+        artistCount=0,
+        albumCount=0,
+        songCount=limit,
+    )
+    songs = _items(response.get("searchResult2", {}).get("song"))
+    # Keep only the normalized fields used for matching, once per search
+    return tuple(normalize_candidate(song) for song in songs)
+
+
+class SongIndex:
+    """Every Navidrome song held in memory so tracks match without a search each.
+
+    Songs are paged in once through an empty search3 query, which Navidrome
+    answers with the whole library, and looked up by title and artist tokens.
+    The index is read-only after ``build`` and safe to share across threads.
+    """
+
+    def __init__(self, songs: List[dict]) -> None:
+        self._songs = songs
+        self._by_token: dict[str, List[int]] = {}
+        for position, song in enumerate(songs):
+            for token in song["tokens"]:
+                self._by_token.setdefault(token, []).append(position)
+        self._common_token_size = max(
+            int(len(songs) * _SONG_INDEX_COMMON_TOKEN_SHARE),
+            _SONG_INDEX_COMMON_TOKEN_MIN,
+        )
+        # Membership sets for common tokens, so they can be counted against a
+        # few candidates without walking their posting lists
+        self._common_tokens: dict[str, FrozenSet[int]] = {
+            token: frozenset(positions)
+            for token, positions in self._by_token.items()
+            if len(positions) > self._common_token_size
+        }
+
+    def __len__(self) -> int:
+        return len(self._songs)
+
+    @classmethod
+    def build(cls, navidrome: Connection) -> "SongIndex":
+        songs: List[dict] = []
+        seen_ids: set = set()
+        while True:
+            response = navidrome.search3(
+                query="",
+                artistCount=0,
+                albumCount=0,
+                songCount=_SONG_INDEX_PAGE_SIZE,
+                songOffset=len(songs),
+            )
+            page = _items(response.get("searchResult3", {}).get("song"))
+            new_songs = [song for song in page if song.get("id") not in seen_ids]
+            # A server ignoring songOffset would hand back the same page forever
+            if not new_songs:
+                break
+            seen_ids.update(song.get("id") for song in new_songs)
+            songs.extend(normalize_candidate(song) for song in new_songs)
+            if len(page) < _SONG_INDEX_PAGE_SIZE:
+                break
+        logger.info("Indexed %s Navidrome songs", len(songs))
+        return cls(songs)
+
+    def search(self, title: str, artist: str, limit: int) -> Tuple[dict, ...]:
+        """Return up to ``limit`` songs sharing the most tokens with the query.
+
+        Candidates come from the query tokens that are not common, or from the
+        rarest one if all are. Common tokens still count towards the score of
+        those candidates, so a lookup costs the size of a few short posting
+        lists rather than of the library.
+        """
+        query_tokens = sorted(
+            (token for token in tokens(title, artist) if token in self._by_token),
+            key=lambda token: len(self._by_token[token]),
+        )
+        hits: Counter[int] = Counter()
+        common: List[FrozenSet[int]] = []
+        for rank, token in enumerate(query_tokens):
+            if rank and token in self._common_tokens:
+                common.append(self._common_tokens[token])
+            else:
+                hits.update(self._by_token[token])
+        for positions in common:
+            for position in hits:
+                if position in positions:
+                    hits[position] += 1
+        return tuple(self._songs[position] for position, _ in hits.most_common(limit))
 
 
-def _search_tracks(navidrome: Connection, track: Track, limit: int = 25) -> List[dict]:
-    query_parts = [track.title, track.artist]
-    query = " ".join(part for part in query_parts if part)
-    if not query:
-        return []
+@lru_cache(maxsize=_SEARCH_CACHE_SIZE)
+def _resolve_track(
+    navidrome: Connection,
+    title: str,
+    artist: str,
+    album: str,
+    limit: int = _DEFAULT_SEARCH_LIMIT,
+    threshold: float = 0.0,
+    song_index: SongIndex | None = None,
+    query: Tuple[str, str] | None = None,
+) -> Tuple[str | None, float]:
+    """Return the id and score of the best Navidrome match for a normalized track.
+
+    ``query`` holds the title and artist to send to Navidrome, which defaults
+    to the normalized fields.
+    """
+    if song_index is not None:
+        candidates = song_index.search(title, artist, limit)
+    else:
+        candidates = _search_tracks(navidrome, *(query or (title, artist)), limit)
+    best_candidate, best_score = pick_best_match(
+        candidates, title, artist, album, threshold
+    )
+    if best_candidate is None or not best_candidate.get("id"):
+        return None, best_score
+    return str(best_candidate["id"]), best_score
+
+
+def _track_key(track: Track) -> Tuple[str, str, str]:
+    return track.title_norm, track.artist_norm, track.album_norm
+
+
+def _track_query(track: Track) -> Tuple[str, str]:
+    return search_text(track.title), search_text(track.artist)
 
-    logger.debug("Searching Navidrome for track '%s'", query)
 
+def _match_track(
+    navidrome: Connection,
+    track_key: Tuple[str, str, str],
+    limit: int = _DEFAULT_SEARCH_LIMIT,
+    threshold: float = 0.0,
+    song_index: SongIndex | None = None,
+    query: Tuple[str, str] | None = None,
+) -> Tuple[str | None, float]:
     try:
-        response = navidrome.search2(
-            query=query,
-            artistCount=0,
-            albumCount=0,
-            songCount=limit,
+        return _resolve_track(
+            navidrome, *track_key, limit, threshold, song_index, query
         )
     except Exception as exc:  # noqa: BLE001
-        logger.info("Navidrome search failed for '%s': %s", track.title, exc)
-        return []
+        logger.info("Navidrome search failed for '%s': %s", track_key[0], exc)
+        return None, 0.0
 
-    songs = response.get("searchResult2", {}).get("song")
-    return _ensure_iterable_songs(songs)
 
+def clear_search_cache() -> None:
+    """Forget memoized Navidrome searches so a new cycle sees fresh results."""
+    _search_tracks.cache_clear()
+    _resolve_track.cache_clear()
 
-def _pick_best_match(candidates: List[dict], track: Track) -> Tuple[dict | None, float]:
-    best_candidate = None
-    best_score = 0.0
-    for candidate in candidates:
-        score = _score_candidate(candidate, track)
-        if score > best_score:
-            best_candidate = candidate
-            best_score = score
-    return best_candidate, best_score
+
+def _match_all_tracks(
+    navidrome: Connection,
+    tracks: Iterable[Track],
+    concurrency: int,
+    limit: int,
+    threshold: float,
+    song_index: SongIndex | None = None,
+) -> dict[Tuple[str, str, str], Tuple[str | None, float]]:
+    """Match each distinct track key against Navidrome, overlapping round-trips.
+
+    Every new key is submitted as soon as ``tracks`` produces it, so
+    searches run while the caller is still fetching the remaining tracks.
+    libsonic builds a fresh urllib request per call and only reads shared
+    connection settings, so one Connection can be used from all workers.
+    Matching against a ``song_index`` is CPU-bound and never leaves the
+    process, so it skips the thread pool.
+    """
+    if concurrency <= 1 or song_index is not None:
+        resolved: dict[Tuple[str, str, str], Tuple[str | None, float]] = {}
+        for track in tracks:
+            key = _track_key(track)
+            if key not in resolved:
+                resolved[key] = _match_track(
+                    navidrome, key, limit, threshold, song_index, _track_query(track)
+                )
+        return resolved
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="navidrome-search"
+    ) as executor:
+        futures: dict[Tuple[str, str, str], Future] = {}
+        for track in tracks:
+            key = _track_key(track)
+            if key not in futures:
+                futures[key] = executor.submit(
+                    _match_track,
+                    navidrome,
+                    key,
+                    limit,
+                    threshold,
+                    None,
+                    _track_query(track),
+                )
+        return {key: future.result() for key, future in futures.items()}
 
 
 def _get_available_navidrome_tracks(
-    navidrome: Connection, tracks: List[Track], threshold: float
+    navidrome: Connection,
+    tracks: Iterable[Track],
+    threshold: float,
+    concurrency: int = 1,
+    search_limit: int = _DEFAULT_SEARCH_LIMIT,
+    song_index: SongIndex | None = None,
 ) -> Tuple[List[str], List[Track]]:
     available_ids: List[str] = []
     available_id_set: set[str] = set()
     missing_tracks: List[Track] = []
+    playlist_tracks: List[Track] = []
 
-    logger.debug(
-        "Resolving availability for %s tracks with threshold %.2f",
-        len(tracks),
+    def collect_tracks() -> Iterator[Track]:
+        for track in tracks:
+            playlist_tracks.append(track)
+            yield track
+
+    # Search each distinct track once as it arrives, then map results back
+    # in playlist order
+    resolved = _match_all_tracks(
+        navidrome,
+        collect_tracks(),
+        concurrency,
+        search_limit,
         threshold,
+        song_index,
     )
 
-    for track in tracks:
-        candidates = _search_tracks(navidrome, track)
-        best_candidate, best_score = _pick_best_match(candidates, track)
+    logger.debug(
+        "Resolved availability for %s tracks (%s distinct) with threshold %.2f "
+        "(concurrency=%s)",
+        len(playlist_tracks),
+        len(resolved),
+        threshold,
+        concurrency,
+    )
 
-        if best_candidate and best_score >= threshold:
-            track_id = best_candidate.get("id")
-            if track_id:
-                track_id_str = str(track_id)
-                if track_id_str in available_id_set:
-                    logger.debug(
+    # Bound once, this loop runs for every track of every playlist
+    debug_on = logger.isEnabledFor(logging.DEBUG)
+    log_debug = logger.debug
+    add_available = available_ids.append
+    add_seen = available_id_set.add
+    add_missing = missing_tracks.append
+
+    for track in playlist_tracks:
+        track_id_str, best_score = resolved[_track_key(track)]
+        if track_id_str and best_score >= threshold:
+            if track_id_str in available_id_set:
+                if debug_on:
+                    log_debug(
                         "Duplicate Navidrome id %s for '%s - %s' skipped",
                         track_id_str,
                         track.title,
                         track.artist,
                     )
-                    continue
+                continue
 
-                available_ids.append(track_id_str)
-                available_id_set.add(track_id_str)
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(
-                        "Matched track '%s - %s' with Navidrome id %s (score=%.2f)",
-                        track.title,
-                        track.artist,
-                        track_id_str,
-                        best_score,
-                    )
-            else:
-                missing_tracks.append(track)
+            add_available(track_id_str)
+            add_seen(track_id_str)
+            if debug_on:
+                log_debug(
+                    "Matched track '%s - %s' with Navidrome id %s (score=%.2f)",
+                    track.title,
+                    track.artist,
+                    track_id_str,
+                    best_score,
+                )
         else:
-            missing_tracks.append(track)
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(
+            add_missing(track)
+            if debug_on:
+                log_debug(
                     "No suitable Navidrome match for '%s - %s' (best score %.2f)",
                     track.title,
                     track.artist,
@@ -177,18 +409,57 @@ def _get_available_navidrome_tracks(
     return available_ids, missing_tracks
 
 
-def _find_existing_playlist(navidrome: Connection, playlist_name: str) -> dict | None:
-    try:
-        response = navidrome.getPlaylists()
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Failed to fetch Navidrome playlists: %s", exc)
-        return None
-
-    playlists = response.get("playlists", {}).get("playlist")
-    for item in _ensure_iterable_songs(playlists):
-        if item.get("name") == playlist_name:
-            return item
-    return None
+class PlaylistIndex:
+    """Navidrome playlists keyed by name, fetched once and shared across syncs.
+
+    Create and delete operations performed by this module are applied to the
+    index directly, so it stays accurate without refetching. Playlists are
+    synced concurrently; hold ``name_lock(name)`` while changing a playlist so
+    same-named syncs run one after another.
+    """
+
+    def __init__(self, navidrome: Connection) -> None:
+        self._navidrome = navidrome
+        self._by_name: dict[str, dict] | None = None
+        # Guards the index itself only, never held across playlist changes
+        self._lock = threading.Lock()
+        self._name_locks: dict[str, threading.Lock] = {}
+
+    def _load(self) -> dict[str, dict]:
+        if self._by_name is None:
+            try:
+                response = self._navidrome.getPlaylists()
+            except Exception as exc:  # noqa: BLE001
+                # Not cached, the next lookup retries
+                logger.error("Failed to fetch Navidrome playlists: %s", exc)
+                return {}
+
+            by_name: dict[str, dict] = {}
+            for item in _items(response.get("playlists", {}).get("playlist")):
+                # Keep the first playlist when several share a name
+                by_name.setdefault(item.get("name"), item)
+            self._by_name = by_name
+            logger.debug("Indexed %s existing Navidrome playlists", len(by_name))
+        return self._by_name
+
+    def name_lock(self, name: str) -> threading.Lock:
+        """Return the lock serializing changes to the playlist called ``name``."""
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+
+    def get(self, name: str) -> dict | None:
+        with self._lock:
+            return self._load().get(name)
+
+    def add(self, item: dict) -> None:
+        with self._lock:
+            if self._by_name is not None:
+                self._by_name[item.get("name")] = item
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            if self._by_name is not None:
+                self._by_name.pop(name, None)
 
 
 def _create_playlist(navidrome: Connection, playlist_name: str) -> str:
@@ -203,32 +474,81 @@ def _create_playlist(navidrome: Connection, playlist_name: str) -> str:
     return str(playlist_id)
 
 
+def _clear_playlist(
+    navidrome: Connection,
+    playlist_id: str,
+    chunk_size: int = _DEFAULT_ADD_TRACKS_CHUNK_SIZE,
+) -> None:
+    """Remove every song from a playlist, keeping its id, cover and settings."""
+    response = navidrome.getPlaylist(pid=playlist_id)
+    song_count = len(_items(response.get("playlist", {}).get("entry")))
+    logger.debug(
+        "Removing %s tracks from Navidrome playlist id %s", song_count, playlist_id
+    )
+    # Subsonic removes by position; work back from the end so the positions
+    # of the songs still to remove do not shift between requests
+    for end in range(song_count, 0, -chunk_size):
+        navidrome.updatePlaylist(
+            lid=playlist_id,
+            songIndexesToRemove=list(range(max(end - chunk_size, 0), end)),
+        )
+
+
 def _ensure_playlist_id(
     navidrome: Connection,
     playlist: Playlist,
     append: bool,
+    playlist_index: PlaylistIndex,
+    chunk_size: int = _DEFAULT_ADD_TRACKS_CHUNK_SIZE,
 ) -> str:
-    existing = _find_existing_playlist(navidrome, playlist.name)
+    """Return the id of an empty (or, when appending, existing) playlist.
+
+    Callers hold ``playlist_index.name_lock(playlist.name)``.
+    """
+    existing = playlist_index.get(playlist.name)
     if existing and not append:
         try:
-            navidrome.deletePlaylist(pid=existing.get("id"))
+            _clear_playlist(navidrome, str(existing.get("id")), chunk_size)
             logger.info(
-                "Reset existing Navidrome playlist '%s' before syncing",
+                "Cleared existing Navidrome playlist '%s' before syncing",
                 playlist.name,
             )
-            existing = None
         except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(
-                f"Failed to reset Navidrome playlist '{playlist.name}': {exc}"
-            ) from exc
+            logger.warning(
+                "Failed to clear Navidrome playlist '%s', recreating it: %s",
+                playlist.name,
+                exc,
+            )
+            try:
+                navidrome.deletePlaylist(pid=existing.get("id"))
+                playlist_index.remove(playlist.name)
+                existing = None
+            except Exception as delete_exc:  # noqa: BLE001
+                raise RuntimeError(
+                    f"Failed to reset Navidrome playlist '{playlist.name}': "
+                    f"{delete_exc}"
+                ) from delete_exc
 
     if existing:
         return str(existing.get("id"))
 
-    return _create_playlist(navidrome, playlist.name)
+    playlist_id = _create_playlist(navidrome, playlist.name)
+    playlist_index.add({"id": playlist_id, "name": playlist.name})
+    return playlist_id
 
 
-def _add_tracks(navidrome: Connection, playlist_id: str, track_ids: List[str]) -> None:
+def _add_tracks(
+    navidrome: Connection,
+    playlist_id: str,
+    track_ids: List[str],
+    comment: str | None = None,
+    chunk_size: int = _DEFAULT_ADD_TRACKS_CHUNK_SIZE,
+) -> None:
+    """Add tracks to a playlist, setting its comment in the same request.
+
+    Large id lists are split into chunks to keep each request body bounded.
+    Chunks are sent one after another since Navidrome appends in call order.
+    """
     if not track_ids:
         return
 
@@ -238,22 +558,35 @@ def _add_tracks(navidrome: Connection, playlist_id: str, track_ids: List[str]) -
         playlist_id,
     )
 
-    try:
-        navidrome.updatePlaylist(lid=playlist_id, songIdsToAdd=track_ids)
-    except Exception as exc:  # noqa: BLE001
-        raise RuntimeError(
-            f"Failed to add tracks {', '.join(track_ids)} to playlist {playlist_id}: {exc}"
-        ) from exc
+    for start in range(0, len(track_ids), chunk_size):
+        chunk = track_ids[start:start + chunk_size]
+        try:
+            navidrome.updatePlaylist(
+                lid=playlist_id, comment=comment, songIdsToAdd=chunk
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(
+                f"Failed to add tracks {', '.join(chunk)} to playlist {playlist_id}: {exc}"
+            ) from exc
+        # Only the first request needs to carry the comment
+        comment = None
 
 
 def update_or_create_navidrome_playlist(
     navidrome: Connection,
     playlist: Playlist,
-    tracks: List[Track],
+    tracks: Iterable[Track],
     userInputs: UserInputs,
+    playlist_index: PlaylistIndex | None = None,
+    song_index: SongIndex | None = None,
 ) -> None:
     available_track_ids, missing_tracks = _get_available_navidrome_tracks(
-        navidrome, tracks, userInputs.match_confidence_threshold
+        navidrome,
+        tracks,
+        userInputs.match_confidence_threshold,
+        userInputs.navidrome_search_concurrency,
+        userInputs.navidrome_search_limit,
+        song_index,
     )
 
     logger.info(
@@ -275,33 +608,41 @@ def update_or_create_navidrome_playlist(
         )
         return
 
-    try:
-        playlist_id = _ensure_playlist_id(
-            navidrome, playlist, userInputs.append_instead_of_sync
-        )
-    except RuntimeError as exc:
-        logger.error(
-            "Unable to prepare Navidrome playlist %s: %s", playlist.name, exc
-        )
-        return
+    comment = None
+    if playlist.description and userInputs.add_playlist_description:
+        comment = playlist.description
 
-    try:
-        _add_tracks(navidrome, playlist_id, available_track_ids)
-    except RuntimeError as exc:
-        logger.error(
-            "Failed to update Navidrome playlist %s: %s", playlist.name, exc
-        )
-        return
+    playlist_index = playlist_index or PlaylistIndex(navidrome)
+    # Same-named playlists may be synced concurrently; clearing or creating
+    # and then filling one must not interleave with another
+    with playlist_index.name_lock(playlist.name):
+        try:
+            playlist_id = _ensure_playlist_id(
+                navidrome,
+                playlist,
+                userInputs.append_instead_of_sync,
+                playlist_index,
+                userInputs.navidrome_add_chunk_size,
+            )
+        except RuntimeError as exc:
+            logger.error(
+                "Unable to prepare Navidrome playlist %s: %s", playlist.name, exc
+            )
+            return
 
-    if playlist.description and userInputs.add_playlist_description:
         try:
-            navidrome.updatePlaylist(lid=playlist_id, comment=playlist.description)
-        except Exception as exc:  # noqa: BLE001
-            logger.info(
-                "Failed to update description for Navidrome playlist %s: %s",
-                playlist.name,
-                exc,
+            _add_tracks(
+                navidrome,
+                playlist_id,
+                available_track_ids,
+                comment,
+                userInputs.navidrome_add_chunk_size,
+            )
+        except RuntimeError as exc:
+            logger.error(
+                "Failed to update Navidrome playlist %s: %s", playlist.name, exc
             )
+            return
 
     logger.info("Updated Navidrome playlist %s", playlist.name)
 
@@ -0,0 +1,177 @@
+"""Candidate scoring for Navidrome track matching.
+
+Kept free of I/O and fully annotated so it can be compiled with mypyc; the
+plain Python module is used when no compiled build is present.
+"""
+import re
+import unicodedata
+from operator import itemgetter
+from typing import FrozenSet, Iterable, Tuple
+
+from rapidfuzz.distance import Indel
+
+
+# The weighted field sum can land just below 1.0 through float rounding
+PERFECT_SCORE: float = 1.0 - 1e-9
+_TOKEN_PATTERN = re.compile(r"\w+")
+# Quotes and apostrophes in their ASCII and typographic forms ("Don’t" and
+# "Don't" must match). Navidrome drops these from its search index as well,
+# other punctuation is kept as the normalized title doubles as the query.
+_QUOTES_TABLE = str.maketrans(
+    "", "", "'\"`\u00b4\u2018\u2019\u201a\u201b\u201c\u201d\u201e\u201f"
+)
+# Combining marks are only dropped from letters below this codepoint, i.e. the
+# Latin blocks, so e.g. Japanese voicing marks survive normalization
+_LATIN_END = "\u0250"
+
+
+def _fold_accents(value: str) -> str:
+    """Drop accents from Latin letters ("Café" -> "Cafe"), keep other scripts."""
+    folded = []
+    base = ""
+    for char in unicodedata.normalize("NFKD", value):
+        if unicodedata.combining(char):
+            if base < _LATIN_END:
+                continue
+        else:
+            base = char
+        folded.append(char)
+    return unicodedata.normalize("NFC", "".join(folded))
+
+
+def normalize(value: str | None) -> str:
+    if not value:
+        return ""
+    if not value.isascii():
+        value = _fold_accents(value)
+    return value.casefold().translate(_QUOTES_TABLE).strip()
+
+
+def search_text(value: str | None) -> str:
+    """Return ``value`` as Navidrome search query text.
+
+    Navidrome only lower-cases its search index and drops quotes, so casefold
+    and compatibility folding (final sigma, full-width forms, ligatures)
+    would make query words stop matching.
+    """
+    return value.lower().translate(_QUOTES_TABLE).strip() if value else ""
+
+
+def tokens(*values: str) -> FrozenSet[str]:
+    """Return the distinct words of already normalized values."""
+    return frozenset(
+        token for value in values for token in _TOKEN_PATTERN.findall(value)
+    )
+
+
+def sequence_score(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    return Indel.normalized_similarity(a, b)
+
+
+def length_bound(a: str, b: str) -> float:
+    """Upper bound of ``sequence_score`` from the string lengths alone.
+
+    The Indel distance is at least the length difference, and the normalized
+    similarity divides it by the combined length.
+    """
+    if not a or not b:
+        return 0.0
+    len_a = len(a)
+    len_b = len(b)
+    return 1.0 - abs(len_a - len_b) / (len_a + len_b)
+
+
+def score_candidate(
+    candidate: dict,
+    track_title: str,
+    track_artist: str,
+    track_album: str,
+    floor: float = 0.0,
+) -> float:
+    """Score a candidate against track fields; both sides already normalized.
+
+    Fields are scored title first, and 0.0 is returned as soon as the best
+    achievable total drops below ``floor``.
+    """
+    if track_album:
+        # Weight title highest, then artist, then album
+        title_weight, artist_weight, album_weight = 0.6, 0.3, 0.1
+    else:
+        # No album to compare (e.g. singles), keep the same 2:1 title/artist ratio
+        title_weight, artist_weight, album_weight = 0.67, 0.33, 0.0
+
+    candidate_title = candidate["title"]
+    title_bound = length_bound(candidate_title, track_title)
+    if (title_bound * title_weight) + artist_weight + album_weight < floor:
+        return 0.0
+    title_score = sequence_score(candidate_title, track_title)
+    if (title_score * title_weight) + artist_weight + album_weight < floor:
+        return 0.0
+    artist_score = sequence_score(candidate["artist"], track_artist)
+    partial = (title_score * title_weight) + (artist_score * artist_weight)
+    if not track_album:
+        return partial
+    if partial + album_weight < floor:
+        return 0.0
+    album_score = sequence_score(candidate["album"], track_album)
+    return partial + (album_score * album_weight)
+
+
+def normalize_candidate(song: dict) -> dict:
+    """Project a Subsonic song to its id and normalized match fields."""
+    title = normalize(song.get("title"))
+    artist = normalize(song.get("artist"))
+    return {
+        "id": song.get("id"),
+        "title": title,
+        "artist": artist,
+        "album": normalize(song.get("album")),
+        "tokens": tokens(title, artist),
+    }
+
+
+def pick_best_match(
+    candidates: Iterable[dict],
+    track_title: str,
+    track_artist: str,
+    track_album: str,
+    threshold: float = 0.0,
+) -> Tuple[dict | None, float]:
+    """Return the best normalized candidate for normalized track fields.
+
+    Candidates that cannot reach ``threshold`` are not scored in full, so a
+    result below the threshold may be reported as ``(None, 0.0)``.
+    """
+    query_tokens = tokens(track_title, track_artist)
+    if query_tokens:
+        # Skip candidates without a single title or artist word in common, and
+        # score the closest word matches first so that the bounds in
+        # score_candidate and the perfect-match exit cut in early
+        ranked = [
+            (len(query_tokens & candidate["tokens"]), candidate)
+            for candidate in candidates
+        ]
+        ranked.sort(key=itemgetter(0), reverse=True)
+        candidates = [candidate for overlap, candidate in ranked if overlap]
+
+    # A plain loop beats per-field rapidfuzz.process batching for the handful
+    # of candidates a search returns, and allows stopping at a perfect match.
+    best_candidate = None
+    best_score = 0.0
+    for candidate in candidates:
+        # Only a strictly higher score replaces the current best
+        floor = best_score if best_score > threshold else threshold
+        score = score_candidate(
+            candidate, track_title, track_artist, track_album, floor
+        )
+        if score > best_score:
+            best_candidate = candidate
+            best_score = score
+            # Exact title, artist and album; no later candidate can beat it
+            if best_score >= PERFECT_SCORE:
+                break
+    return best_candidate, best_score
@@ -1,20 +1,31 @@
 import html
 import logging
 import re
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Iterator, List
 
 import spotipy
 from libsonic.connection import Connection
 from spotipy.exceptions import SpotifyException
 
 from .helperClasses import Playlist, Track, UserInputs
-from .navidrome import update_or_create_navidrome_playlist
+from .navidrome import (
+    PlaylistIndex,
+    SongIndex,
+    update_or_create_navidrome_playlist,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Only the track fields used for matching, instead of full track objects
+_PLAYLIST_TRACK_FIELDS = (
+    "items(track(name,artists(name),album(name),external_urls.spotify)),next"
+)
 
 
 def _sanitize_description(raw: str | None) -> str:
@@ -38,7 +49,7 @@ def _sanitize_description(raw: str | None) -> str:
 
 def _get_sp_user_playlists(
     sp: spotipy.Spotify, user_id: str, suffix: str = " - Spotify"
-) -> List[Playlist]:
+) -> List[Playlist] | None:
     """Get metadata for playlists in the given user_id.
 
     Args:
@@ -46,7 +57,8 @@ def _get_sp_user_playlists(
         userId (str): UserId of the spotify account (get it from open.spotify.com/account)
         suffix (str): Identifier for source
     Returns:
-        List[Playlist]: list of Playlist objects with playlist metadata fields
+        List[Playlist] | None: list of Playlist objects with playlist metadata
+            fields, or None if they could not all be fetched
     """
     playlists = []
 
@@ -70,6 +82,7 @@ def _get_sp_user_playlists(
                         id=playlist["uri"],
                         name=playlist["name"] + suffix,
                         description=description,
+                        snapshot_id=playlist.get("snapshot_id") or "",
                     )
                 )
                 if not description:
@@ -89,116 +102,193 @@ def _get_sp_user_playlists(
         )
     except SpotifyException as exc:
         logger.error("Spotify user playlist fetch failed: %s", exc)
+        return None
     except Exception as exc:  # noqa: BLE001
         logger.error("Unexpected Spotify error: %s", exc)
+        return None
     return playlists
 
 
-def _get_sp_tracks_from_playlist(
-    sp: spotipy.Spotify, user_id: str, playlist: Playlist
-) -> List[Track]:
-    """Return list of tracks with metadata.
+def _page_tracks(page: dict) -> Iterator[Track]:
+    """Yield Track objects for one page of Spotify playlist items."""
+    return (
+        Track(
+            track["name"],
+            track["artists"][0]["name"],
+            track["album"]["name"],
+            # Tracks may no longer be on spotify in such cases use ""
+            track["external_urls"].get("spotify", ""),
+        )
+        for track in (item.get("track") for item in page["items"])
+        if track
+    )
+
+
+def _iter_sp_tracks(
+    sp: spotipy.Spotify, playlist: Playlist, sp_lock: threading.Lock
+) -> Iterator[Track]:
+    """Yield tracks with metadata, fetching further pages as they are consumed.
 
     Args:
         sp (spotipy.Spotify): Spotify configured instance
-        user_id (str): spotify user id
         playlist (Playlist): Playlist object
-    Returns:
-        List[Track]: list of Track objects with track metadata fields
+        sp_lock (threading.Lock): Held around every call on ``sp``
+    Yields:
+        Track: Track objects with track metadata fields
     """
 
-    def extract_sp_track_metadata(track) -> Track:
-        title = track["track"]["name"]
-        artist = track["track"]["artists"][0]["name"]
-        album = track["track"]["album"]["name"]
-        # Tracks may no longer be on spotify in such cases return ""
-        url = track["track"]["external_urls"].get("spotify", "")
-        return Track(title, artist, album, url)
-
     try:
-        sp_playlist_tracks = sp.user_playlist_tracks(user_id, playlist.id)
+        with sp_lock:
+            sp_playlist_tracks = sp.playlist_items(
+                playlist.id,
+                fields=_PLAYLIST_TRACK_FIELDS,
+                additional_types=("track",),
+            )
     except SpotifyException as exc:
         logger.error(
             "Failed to fetch tracks for Spotify playlist %s: %s",
             playlist.name,
             exc,
         )
-        return []
+        return
     except Exception as exc:  # noqa: BLE001
         logger.error(
             "Unexpected error loading Spotify playlist %s: %s",
             playlist.name,
             exc,
         )
-        return []
+        return
 
-    # Only processes first 100 tracks
-    tracks = list(
-        map(
-            extract_sp_track_metadata,
-            [i for i in sp_playlist_tracks["items"] if i.get("track")],
-        )
-    )
-    logger.debug(
-        "Fetched %s tracks for playlist %s (initial page)",
-        len(tracks),
-        playlist.name,
-    )
-
-    # If playlist contains more than 100 tracks this loop is useful
-    while sp_playlist_tracks["next"]:
-        sp_playlist_tracks = sp.next(sp_playlist_tracks)
-        tracks.extend(
-            list(
-                map(
-                    extract_sp_track_metadata,
-                    [i for i in sp_playlist_tracks["items"] if i.get("track")],
-                )
-            )
-        )
+    total = 0
+    # Each page holds up to 100 tracks, follow "next" for the rest
+    while True:
+        for track in _page_tracks(sp_playlist_tracks):
+            total += 1
+            yield track
         logger.debug(
-            "Accumulated %s tracks for playlist %s", len(tracks), playlist.name
+            "Accumulated %s tracks for playlist %s", total, playlist.name
         )
+        if not sp_playlist_tracks["next"]:
+            break
+        with sp_lock:
+            sp_playlist_tracks = sp.next(sp_playlist_tracks)
 
     logger.info(
         "Fetched %s total tracks for Spotify playlist %s",
-        len(tracks),
+        total,
         playlist.name,
     )
-    return tracks
+
+
+def _sync_playlist(
+    sp: spotipy.Spotify,
+    navidrome: Connection,
+    playlist: Playlist,
+    userInputs: UserInputs,
+    playlist_index: PlaylistIndex,
+    song_index: SongIndex | None,
+    sp_lock: threading.Lock,
+) -> None:
+    logger.info("Syncing playlist '%s'", playlist.name)
+    tracks = _iter_sp_tracks(sp, playlist, sp_lock)
+    first = next(tracks, None)
+    if first is None:
+        logger.warning(
+            "Skipping playlist '%s' because no matching tracks were fetched",
+            playlist.name,
+        )
+        return
+    # Navidrome searches start while the remaining Spotify pages are fetched
+    update_or_create_navidrome_playlist(
+        navidrome,
+        playlist,
+        chain((first,), tracks),
+        userInputs,
+        playlist_index,
+        song_index,
+    )
 
 
 def spotify_playlist_sync(
     sp: spotipy.Spotify, navidrome: Connection, userInputs: UserInputs
-) -> None:
+) -> List[Playlist] | None:
     """Create or update Navidrome playlists using Spotify playlists.
 
     Args:
         sp (spotipy.Spotify): Spotify configured instance
         navidrome (Connection): Configured Navidrome connection
+    Returns:
+        List[Playlist] | None: Spotify playlists discovered for the user, or
+            None if the playlist list could not be fetched
     """
     playlists = _get_sp_user_playlists(
         sp,
         userInputs.spotify_user_id,
         " - Spotify" if userInputs.append_service_suffix else "",
     )
+    if playlists is None:
+        # Reported as a failed cycle so the retry backoff applies
+        return None
     if playlists:
         logger.info(
             "Beginning sync for %s Spotify playlists", len(playlists)
         )
-        for playlist in playlists:
-            logger.info("Syncing playlist '%s'", playlist.name)
-            tracks = _get_sp_tracks_from_playlist(
-                sp, userInputs.spotify_user_id, playlist
-            )
-            if not tracks:
+        playlist_index = PlaylistIndex(navidrome)
+        song_index = None
+        if userInputs.navidrome_song_index:
+            try:
+                song_index = SongIndex.build(navidrome)
+            except Exception as exc:  # noqa: BLE001
                 logger.warning(
-                    "Skipping playlist '%s' because no matching tracks were fetched",
+                    "Failed to index Navidrome songs, searching per track instead: %s",
+                    exc,
+                )
+            else:
+                # Servers without empty-query support, or a library mid-rescan,
+                # return nothing; matching against that would miss every track
+                if not len(song_index):
+                    logger.warning(
+                        "Navidrome returned no songs to index, "
+                        "searching per track instead"
+                    )
+                    song_index = None
+        workers = min(userInputs.playlist_sync_concurrency, len(playlists))
+        # The spotipy client shares one requests.Session and its token cache
+        # file between callers, so only one worker talks to Spotify at a time;
+        # Navidrome matching and uploads still run in parallel.
+        sp_lock = threading.Lock()
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="playlist-sync"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _sync_playlist,
+                    sp,
+                    navidrome,
+                    playlist,
+                    userInputs,
+                    playlist_index,
+                    song_index,
+                    sp_lock,
+                ): playlist
+                for playlist in playlists
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                playlist = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:  # noqa: BLE001
+                    # One failing playlist must not abort the rest of the batch
+                    logger.exception(
+                        "Failed to sync playlist '%s': %s", playlist.name, exc
+                    )
+                logger.info(
+                    "Finished playlist '%s' (%s/%s)",
                     playlist.name,
+                    done,
+                    len(playlists),
                 )
-                continue
-            update_or_create_navidrome_playlist(
-                navidrome, playlist, tracks, userInputs
-            )
     else:
         logger.error("No Spotify playlists found for given user")
+    return playlists